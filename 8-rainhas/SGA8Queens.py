@@ -1,7 +1,296 @@
 import numpy as np
-from typing import Dict, List
 from functools import reduce
-from collections import Counter
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    # Without numba the kernels below simply run as plain Python.
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+# Columns of each of the 28 distinct pairs of queens, and their distance.
+PAIR_I, PAIR_J = np.triu_indices(8, k=1)
+PAIR_COL_DIFF = (PAIR_J - PAIR_I).astype(np.int8)
+
+# Number of random values drawn at once by the genetic operators' buffers.
+RNG_BUFFER_SIZE = 4096
+
+
+def individual_keys(population):
+    # Each int8 row of the population is a single 64-bit word. Alleles are
+    # never 0, so viewing the rows as 8-byte strings drops no trailing null
+    # bytes and gives the same keys as row.tobytes(), for all rows at once.
+    return population.view('S8').ravel().tolist()
+
+
+def population_fitness(population):
+    # Fitness of every row of a (pop_size, 8) int8 matrix at once. Each
+    # individual gets 48 buckets: 16 for the rows (only 8 used), 16 for the
+    # main diagonals and 16 for the secondary ones. A single bincount over
+    # the whole population then gives every histogram.
+    pop_size = population.shape[0]
+    cols = np.arange(8)
+    buckets = np.concatenate((population - 1,
+                              16 + population + cols - 1,
+                              32 + 8 - population + cols), axis=1)
+    buckets += 48 * np.arange(pop_size)[:, np.newaxis]
+    hist = np.bincount(buckets.ravel(), minlength=48 * pop_size)
+    hist = hist.reshape(pop_size, 48)
+    conflicts = (hist * (hist - 1)).sum(axis=1) // 2
+    return 1 / (conflicts + 1)
+
+
+# ###############
+# NUMBA KERNELS
+# ###############
+
+# Explicit signatures make numba compile the kernels when the module is
+# imported instead of on their first call.
+
+@njit('float64(int8[:])', cache=True)
+def fitness_int(t):
+    # Number of conflicts: pairs of queens in the same row or in the same
+    # diagonal, i.e. whose row distance equals their column distance.
+    conflicts = 0
+    for k in range(PAIR_I.shape[0]):
+        row_diff = abs(t[PAIR_I[k]] - t[PAIR_J[k]])
+        if row_diff == 0 or row_diff == PAIR_COL_DIFF[k]:
+            conflicts += 1
+    return 1 / (conflicts + 1)
+
+
+def _specialized_fitness(n):
+    # Partially evaluate the fitness for n queens into one expression with a
+    # term per pair of columns: no loops, arrays or numpy scalars involved.
+    genes = ', '.join(f't{i}' for i in range(n))
+    conflicts = ' + '.join(
+        f'((t{i} == t{j}) | (abs(t{i} - t{j}) == {j - i}))'
+        for i in range(n) for j in range(i + 1, n))
+    source = (f'def fitness_{n}(t):\n'
+              f'    {genes} = t.tolist()\n'
+              f'    return 1 / ({conflicts} + 1)\n')
+    namespace = {}
+    exec(source, namespace)
+    return namespace[f'fitness_{n}']
+
+
+# Compiled by numba, the loop above is as fast as the straight-line version,
+# but in plain Python the latter is several times faster.
+if not HAS_NUMBA:
+    fitness_int = _specialized_fitness(8)
+
+
+@njit('intp(int8[:], int64)', cache=True)
+def _index_of(t, value):
+    for k in range(t.shape[0]):
+        if t[k] == value:
+            return k
+    return -1
+
+
+@njit('UniTuple(int8[:], 2)(int8[:], int8[:], int64)', cache=True)
+def cut_and_crossfill_int(p1, p2, i):
+    c1 = np.zeros(8, dtype=np.int8)
+    c2 = np.zeros(8, dtype=np.int8)
+    c1[:i], c2[:i] = p1[:i], p2[:i]
+
+    # Bitmasks of the alleles already in each child.
+    mask1, mask2 = 0, 0
+    for k in range(i):
+        mask1 |= 1 << int(p1[k])
+        mask2 |= 1 << int(p2[k])
+
+    it1, it2 = i, i
+    for j in range(8):
+        if not (mask1 >> int(p2[j])) & 1:
+            c1[it1] = p2[j]
+            it1 += 1
+            mask1 |= 1 << int(p2[j])
+        if not (mask2 >> int(p1[j])) & 1:
+            c2[it2] = p1[j]
+            it2 += 1
+            mask2 |= 1 << int(p1[j])
+
+    return c1, c2
+
+
+@njit('UniTuple(int8[:], 2)(int8[:], int8[:], int64, int64)', cache=True)
+def pmx_int(p1, p2, i, j):
+    c1 = np.zeros(8, dtype=np.int8)
+    c2 = np.zeros(8, dtype=np.int8)
+
+    # Position of each allele in the parents, and whether it is in their
+    # segment.
+    inv1 = np.zeros(9, dtype=np.intp)
+    inv2 = np.zeros(9, dtype=np.intp)
+    in_seg1 = np.zeros(9, dtype=np.bool_)
+    in_seg2 = np.zeros(9, dtype=np.bool_)
+    for k in range(8):
+        inv1[p1[k]] = k
+        inv2[p2[k]] = k
+    for k in range(i, j+1):
+        in_seg1[p1[k]] = True
+        in_seg2[p2[k]] = True
+
+    # Copy segments to children.
+    c1[i:j+1], c2[i:j+1] = p1[i:j+1], p2[i:j+1]
+
+    # For each allele in the segment...
+    for k in range(i, j+1):
+        # If it is not in the segment of the other parent...
+        if not in_seg1[p2[k]]:
+            # ... and the corresponding allele itself is not
+            # in p2's segment, then place this allele at the
+            # position where it is in p2.
+            if not in_seg2[p1[k]]:
+                c1[inv2[p1[k]]] = p2[k]
+            else:
+                # Find the next position that does not contain
+                # an allele in both segments.
+                it = inv2[p1[k]]
+                while in_seg2[p1[it]]:
+                    it = inv2[p1[it]]
+                it = inv2[p1[it]]
+                c1[it] = p2[k]
+        # Analogous for the second child.
+        if not in_seg2[p1[k]]:
+            if not in_seg1[p2[k]]:
+                c2[inv1[p2[k]]] = p1[k]
+            else:
+                it = inv1[p2[k]]
+                while in_seg1[p2[it]]:
+                    it = inv1[p2[it]]
+                it = inv1[p2[it]]
+                c2[it] = p1[k]
+
+    # Fill the remaining positions.
+    for k in range(8):
+        if c1[k] == 0:
+            c1[k] = p2[k]
+        if c2[k] == 0:
+            c2[k] = p1[k]
+
+    return c1, c2
+
+
+@njit('UniTuple(int8[:], 2)(int8[:], int8[:])', cache=True)
+def cyclic_int(p1, p2):
+    c1 = np.zeros(8, dtype=np.int8)
+    c2 = np.zeros(8, dtype=np.int8)
+
+    turn = 0
+    start_i = _index_of(c1, 0)
+    while start_i != -1:
+        if turn == 0:
+            c1[start_i] = p1[start_i]
+            c2[start_i] = p2[start_i]
+        else:
+            c1[start_i] = p2[start_i]
+            c2[start_i] = p1[start_i]
+
+        curr_i = _index_of(p1, p2[start_i])
+        while curr_i != start_i:
+            if turn == 0:
+                c1[curr_i] = p1[curr_i]
+                c2[curr_i] = p2[curr_i]
+            else:
+                c1[curr_i] = p2[curr_i]
+                c2[curr_i] = p1[curr_i]
+            curr_i = _index_of(p1, p2[curr_i])
+        turn = (turn + 1) % 2
+        start_i = _index_of(c1, 0)
+
+    return c1, c2
+
+
+@njit('int8[:, :](int8[:], int8[:])', cache=True)
+def edge_table_int(p1, p2):
+    # Row v holds the neighbours of allele v in both parents, with 0 for
+    # removed edges. Row 0 is unused.
+    table = np.zeros((9, 4), dtype=np.int8)
+    for k in range(8):
+        table[p1[k], 0] = p1[k - 1]
+        table[p1[k], 1] = p1[(k + 1) % 8]
+        table[p2[k], 2] = p2[k - 1]
+        table[p2[k], 3] = p2[(k + 1) % 8]
+    return table
+
+
+@njit('int8[:](int8[:, :], float64[:])', cache=True)
+def edge_child_int(table, rand_vals):
+    # Build one child from the edge table, which is consumed. rand_vals holds
+    # 8 uniform values in [0, 1): the first picks the starting allele and
+    # each of the others picks among the candidates of one step.
+    child = np.zeros(8, dtype=np.int8)
+    in_child = np.zeros(9, dtype=np.bool_)
+    counts = np.zeros(9, dtype=np.int8)
+    candidates = np.zeros(8, dtype=np.int8)
+
+    curr_el = 1 + int(rand_vals[0] * 8)
+    for k in range(8):
+        if k > 0:
+            counts[:] = 0
+            num_edges = 0
+            for c in range(4):
+                if table[curr_el, c] != 0:
+                    counts[table[curr_el, c]] += 1
+                    num_edges += 1
+
+            num_candidates = 0
+            if num_edges > 0:
+                # Common edges appear twice: pick one of them if any.
+                for v in range(1, 9):
+                    if counts[v] == 2:
+                        candidates[num_candidates] = v
+                        num_candidates += 1
+
+                # Otherwise pick the element with the shortest list of
+                # distinct remaining edges.
+                if num_candidates == 0:
+                    smallest_length = 5
+                    for v in range(1, 9):
+                        if counts[v] == 0:
+                            continue
+                        length = 0
+                        for c in range(4):
+                            x = table[v, c]
+                            if x == 0:
+                                continue
+                            seen = False
+                            for d in range(c):
+                                if table[v, d] == x:
+                                    seen = True
+                            if not seen:
+                                length += 1
+                        if length < smallest_length:
+                            smallest_length = length
+                            num_candidates = 0
+                        if length == smallest_length:
+                            candidates[num_candidates] = v
+                            num_candidates += 1
+            else:
+                for v in range(1, 9):
+                    if not in_child[v]:
+                        candidates[num_candidates] = v
+                        num_candidates += 1
+
+            curr_el = candidates[int(rand_vals[k] * num_candidates)]
+
+        child[k] = curr_el
+        in_child[curr_el] = True
+        for v in range(1, 9):
+            for c in range(4):
+                if table[v, c] == curr_el:
+                    table[v, c] = 0
+
+    return child
+
+# ###############
 
 
 class SGA8Queens(object):
@@ -19,15 +308,31 @@ class SGA8Queens(object):
         # Mutation probability.
         self.p_m = mutation_prob
 
-        # Population size.
+        # Population size. The population is a (pop_size, 8) int8 matrix with
+        # one individual per row.
         self.pop_size = pop_size
         self.population = None
         self.pop_fitness = None
+        # Highest value in pop_fitness, kept up to date by the survivor
+        # selection methods.
+        self.best_fit = None
 
         # Number of evaluations of the fitness function.
         self.num_fitness_eval = 0
 
-        # Use binary string representation for population.
+        # Numpy's random number generator, shared by all genetic operators.
+        self.rng = np.random.default_rng()
+        # Buffers of pre-drawn uniform values in [0, 1), sorted pairs of
+        # distinct gene positions and single cut positions.
+        self._uniforms = self._buffered(self.rng.random)
+        self._pairs = self._buffered(self._draw_pairs)
+        self._cuts = self._buffered(lambda n: self.rng.integers(0, 8, n))
+
+        # Fitness values already computed, indexed by the individual's genes.
+        self._fit_cache = {}
+
+        # Use binary string representation for the reported solution. The
+        # population itself is always stored as int8.
         self.use_binary_rep = use_binary_rep
 
         # Set recombination method. Uses cut and crossfill for 1.
@@ -81,50 +386,52 @@ class SGA8Queens(object):
     # #########################
 
     def fitness(self, table):
-        # Based on https://bit.ly/32zycds.
-        eps = 1
-        N = 8
-        # Number of conflicts.
-        result = 0
-        # Occurences of a queen in a row.
-        f_row = np.zeros(8)
-        # Occurences of a queen in the main diagonal.
-        f_mdiag = np.zeros(16)
-        # Occurences of a queen in the secondary diagonal.
-        f_sdiag = np.zeros(16)
-
-        for i in range(N):
-            if self.use_binary_rep:
-                queen_pos = int(table[i], 2)
-            else:
-                queen_pos = table[i]
-            f_row[queen_pos - 1] += 1
-            f_mdiag[queen_pos + i - 1] += 1
-            f_sdiag[N - queen_pos + i - 1] += 1
-
-        for i in range(2*N):
-            x, y, z = 0, 0, 0
-            if i < N:
-                x = f_row[i]
-            y = f_mdiag[i]
-            z = f_sdiag[i]
-            result += ((x * (x - 1)) + (y * (y - 1)) + (z * (z - 1))) / 2
+        # Fitness is pure on the table, so reuse any previous evaluation. The
+        # table's 8 genes are keyed as one 8-byte word.
+        key = table.tobytes()
+        value = self._fit_cache.get(key)
+        if value is not None:
+            return value
 
+        # Based on https://bit.ly/32zycds.
+        value = fitness_int(table)
+        self._fit_cache[key] = value
         self.num_fitness_eval += 1
 
-        return 1 / (result + eps)
+        return value
 
     def random_init_population(self):
-        rng = np.random.default_rng()
-
-        if self.use_binary_rep:
-            self.population = [self._to_binary_string(rng.permutation(np.arange(1, 9)))
-                               for i in range(self.pop_size)]
-        else:
-            self.population = [list(rng.permutation(np.arange(1, 9)))
-                               for i in range(self.pop_size)]
-
-        self.pop_fitness = np.array([self.fitness(x) for x in self.population])
+        self.population = self.rng.permuted(
+            np.tile(np.arange(1, 9, dtype=np.int8), (self.pop_size, 1)), axis=1)
+
+        self.pop_fitness = population_fitness(self.population)
+        self._fit_cache.update(zip(individual_keys(self.population),
+                                   self.pop_fitness.tolist()))
+        self.num_fitness_eval += self.pop_size
+        self.best_fit = self.pop_fitness.max()
+
+    def _set_fitness(self, index, value):
+        # Update the fitness table and the best fitness. The whole table only
+        # needs to be scanned when the best individual gets worse.
+        old_value = self.pop_fitness[index]
+        self.pop_fitness[index] = value
+        if value >= self.best_fit:
+            self.best_fit = value
+        elif old_value == self.best_fit:
+            self.best_fit = self.pop_fitness.max()
+
+    def _buffered(self, draw):
+        # Yield the values of draw(RNG_BUFFER_SIZE) one by one, drawing a new
+        # batch whenever the previous one is used up.
+        while True:
+            yield from draw(RNG_BUFFER_SIZE).tolist()
+
+    def _draw_pairs(self, n):
+        # n pairs of distinct positions, each sorted in increasing order.
+        i = self.rng.integers(0, 8, n)
+        j = self.rng.integers(0, 7, n)
+        j += j >= i
+        return np.sort(np.stack((i, j), axis=1), axis=1)
 
     def _to_binary_string(self, int_p):
         # The format string: convert the argument to a 3-bit binary filling
@@ -135,17 +442,44 @@ class SGA8Queens(object):
     def run(self):
         self.random_init_population()
 
-        while self.num_fitness_eval < 10000 and self.pop_fitness.max() < 1:
-            p1, p2 = self.select_parents()
-            c1, c2 = self.recombine(p1, p2)
-            c1 = self.mutate(c1)
-            c2 = self.mutate(c2)
-            self.select_survivors(c1, c2, p1, p2)
+        # The chosen methods never change during a run, so look them up once.
+        select_parents = self.select_parents
+        recombine = self.recombine
+        mutate = self.mutate
+        select_survivors = self.select_survivors
+
+        # Cached fitness values do not count as evaluations, so also bound the
+        # number of generations in case no new individuals show up.
+        num_generations = 0
+        while (self.num_fitness_eval < 10000 and num_generations < 10000
+               and self.best_fit < 1):
+            p1, p2, p1_index, p2_index = select_parents()
+            c1, c2, crossed = recombine(p1, p2)
+            c1, c1_mutated = mutate(c1)
+            c2, c2_mutated = mutate(c2)
+            # A child that was neither recombined nor mutated is a copy of its
+            # parent, so it inherits the parent's fitness without a lookup.
+            if crossed or c1_mutated:
+                c1_fit = self.fitness(c1)
+            else:
+                c1_fit = self.pop_fitness[p1_index]
+            if crossed or c2_mutated:
+                c2_fit = self.fitness(c2)
+            else:
+                c2_fit = self.pop_fitness[p2_index]
+            select_survivors(c1, c2, c1_fit, c2_fit, p1_index, p2_index)
+            num_generations += 1
+
+        solution = self.population[self.pop_fitness.argmax()]
+        if self.use_binary_rep:
+            solution = self._to_binary_string(solution)
+        else:
+            solution = solution.tolist()
 
         report = {'num fitness eval': self.num_fitness_eval,
-                  'convergence': self.pop_fitness.max() == 1,
-                  'num solutions': len([p for p in self.pop_fitness if p == self.pop_fitness.max()]),
-                  'solution': self.population[self.pop_fitness.argmax()]}
+                  'convergence': self.best_fit == 1,
+                  'num solutions': len([p for p in self.pop_fitness if p == self.best_fit]),
+                  'solution': solution}
 
         return report
 
@@ -156,31 +490,24 @@ class SGA8Queens(object):
     # #########################
 
     def select_2_out_5(self):
-        # Numpy's random number generator.
-        rng = np.random.default_rng()
         # Get 5 different random individuals from the population.
-        candidates = rng.choice(self.population, size=5, replace=False)
-        # Find the two candidates with the highest fitness.
-        candidates_fitness = np.array([self.fitness(x) for x in candidates])
-        p1, p2 = candidates[np.argsort(-candidates_fitness)[:2]]
-        p1, p2 = list(p1), list(p2)
-        return p1, p2
+        candidates = self.rng.choice(self.pop_size, size=5, replace=False)
+        # Find the two candidates with the highest fitness, best first. Their
+        # fitness is already known from the population's fitness table.
+        p1_index, p2_index = candidates[
+            np.argpartition(-self.pop_fitness[candidates], 1)[:2]]
+        return (self.population[p1_index], self.population[p2_index],
+                p1_index, p2_index)
 
     def roulette_selection(self):
-        rng = np.random.default_rng()
-        fitness_sum = self.pop_fitness.sum()
-        parents = []
-
-        for i in range(2):
-            rand_val = rng.random()
-            cum_prob = 0.0
-            for f, index in zip(self.pop_fitness, np.arange(self.pop_size)):
-                if rand_val < cum_prob + (f / fitness_sum):
-                    parents.append(self.population[index])
-                    break
-                cum_prob += f / fitness_sum
-
-        return parents
+        cum_prob = np.cumsum(self.pop_fitness / self.pop_fitness.sum())
+        rand_vals = (next(self._uniforms), next(self._uniforms))
+        # First individual whose cumulative probability exceeds each value.
+        # Rounding may leave cum_prob[-1] slightly below 1, hence the clip.
+        indices = np.searchsorted(cum_prob, rand_vals, side='right')
+        p1_index, p2_index = np.minimum(indices, self.pop_size - 1)
+        return (self.population[p1_index], self.population[p2_index],
+                p1_index, p2_index)
 
     # #########################
 
@@ -190,194 +517,49 @@ class SGA8Queens(object):
 
     def cut_and_crossfill_crossover(self, p1, p2):
         # Implementation of a cut and crossfill crossover.
-        rng = np.random.default_rng()
-        c1 = 8*['']
-        c2 = 8*['']
-
-        if rng.uniform() < self.p_c:
-            i = rng.choice(8)
-            c1[:i], c2[:i] = p1[:i], p2[:i]
-            it1, it2 = i, i
-            for j in range(8):
-                if p2[j] not in c1:
-                    c1[it1] = p2[j]
-                    it1 += 1
-                if p1[j] not in c2:
-                    c2[it2] = p1[j]
-                    it2 += 1
+        crossed = next(self._uniforms) < self.p_c
+        if crossed:
+            i = next(self._cuts)
+            c1, c2 = cut_and_crossfill_int(p1, p2, i)
         else:
-            c1, c2 = p1[:], p2[:]
+            c1, c2 = p1.copy(), p2.copy()
 
-        return c1, c2
+        return c1, c2, crossed
 
     def pmx_crossover(self, p1, p2):
-        rng = np.random.default_rng()
-        c1, c2 = 8*[0], 8*[0]
-
-        if rng.uniform() < self.p_c:
+        crossed = next(self._uniforms) < self.p_c
+        if crossed:
             # Choose two random crossover points.
-            i, j = rng.choice(8, size=2, replace=False)
-            if i > j:
-                i, j = j, i
-
-            # Copy segments to children.
-            c1[i:j+1], c2[i:j+1] = p1[i:j+1], p2[i:j+1]
-
-            # For each allele in the segment...
-            for k in range(i, j+1):
-                # If it is not in the segment of the other parent...
-                if p2[k] not in p1[i:j+1]:
-                    # ... and the corresponding allele itself is not
-                    # in p2's segment, then place this allele at the
-                    # position where it is in p2.
-                    if p1[k] not in p2[i:j+1]:
-                        c1[p2.index(p1[k])] = p2[k]
-                    else:
-                        # Find the next position that does not contain
-                        # an allele in both segments.
-                        it = p2.index(p1[k])
-                        while p1[it] in p2[i:j+1]:
-                            it = p2.index(p1[it])
-                        it = p2.index(p1[it])
-                        c1[it] = p2[k]
-                # Analogous for the second child.
-                if p1[k] not in p2[i:j+1]:
-                    if p2[k] not in p1[i:j+1]:
-                        c2[p1.index(p2[k])] = p1[k]
-                    else:
-                        it = p1.index(p2[k])
-                        while p2[it] in p1[i:j+1]:
-                            it = p1.index(p2[it])
-                        it = p1.index(p2[it])
-                        c2[it] = p1[k]
-
-            # Fill the remaining positions.
-            for k in range(8):
-                if c1[k] == 0:
-                    c1[k] = p2[k]
-                if c2[k] == 0:
-                    c2[k] = p1[k]
-        else:
-            c1, c2 = p1[:], p2[:]
-
-        return c1, c2
+            i, j = next(self._pairs)
 
-    def _edge_table(self, p1=[], p2=[]):
-        table = {}
-
-        for index in range(1, len(p1) + 1):
-            edges = []
-            p1_index = p1.index(index)
-            prev_index = p1_index - 1
-            next_index = (p1_index + 1) % len(p1)
-            edges.append(p1[prev_index])
-            edges.append(p1[next_index])
-
-            p2_index = p2.index(index)
-            prev_index = p2_index - 1
-            next_index = (p2_index + 1) % len(p2)
-            edges.append(p2[prev_index])
-            edges.append(p2[next_index])
-
-            edges.sort()
-
-            table[index] = edges
+            c1, c2 = pmx_int(p1, p2, i, j)
+        else:
+            c1, c2 = p1.copy(), p2.copy()
 
-        return table
+        return c1, c2, crossed
 
-    # TODO: confirm if this will work with a string of bits
     def edge_crossover(self, p1, p2):
-        rng = np.random.default_rng()
-        children = []
-
-        def select_next(edge_table: Dict[int, List[int]], current_key: int, current_child: List[int]):
-            element = None
-            if (len(edge_table[current_key]) > 0): 
-                elements_counter = Counter(edge_table[current_key])
-                most_common = elements_counter.most_common(2)
-                with_common_edges = list(filter(lambda x: x[1] == 2, most_common))
-
-                # If there is only one element and it appears twice (i.e. a common edge), return it
-                if len(with_common_edges) == 1:
-                    return most_common[0][0]
-
-                elif len(with_common_edges) > 1:
-                    return rng.choice(most_common)[0]
-
-                # Lengths of the lists of all elements in the current current element list
-                lists_length = list(
-                    map(
-                        lambda x: (x, len(set(edge_table[x]))),
-                        edge_table[current_key]
-                    )
-                )
-
-                # sort tuples by list length in asc order
-                lists_length.sort(key=lambda x: x[1])
-                smallest_length = lists_length[0][1]
-
-                elements_with_smallest_list = list(
-                    filter(lambda x: x[1] == smallest_length, lists_length))
-
-                element = rng.choice(elements_with_smallest_list)[0]
-            else:
-                remaining_elements = set(edge_table.keys()) - set(current_child)
-                element = rng.choice(remaining_elements)
-
-            return element
-
-        if rng.uniform() < self.p_c:
-            # Create two children:
-            for _ in range(2):
-                edge_table = self._edge_table(p1, p2)
-                # Pick a random element as the first one in the child
-                child = [rng.choice(p1)]
-                # child = [1]
-                curr_el = rng.choice(child)
-
-                while len(child) < len(p1):
-                    for key in edge_table:
-                        edge_table[key] = list(
-                            filter(lambda x: x != curr_el, edge_table[key]))
-                    curr_el = select_next(edge_table, curr_el, child)
-                    child.append(curr_el)
-
-                children.append(child)
-
+        crossed = next(self._uniforms) < self.p_c
+        if crossed:
+            # Numba cannot use the Generator, so draw each child's random
+            # values beforehand.
+            rand_vals = self.rng.random((2, 8))
+            edge_table = edge_table_int(p1, p2)
+            c1 = edge_child_int(edge_table.copy(), rand_vals[0])
+            c2 = edge_child_int(edge_table, rand_vals[1])
         else:
-            children = [p1[:], p2[:]]
+            c1, c2 = p1.copy(), p2.copy()
 
-        return children[0], children[1]
+        return c1, c2, crossed
 
     def cyclic_crossover(self, p1, p2):
-        rng = np.random.default_rng()
-        c1, c2 = 8*[0], 8*[0]
-
-        if rng.uniform() < self.p_c:
-            turn = 0
-            while 0 in c1 or 0 in c2:
-                start_i = c1.index(0)
-                if turn == 0:
-                    c1[start_i] = p1[start_i]
-                    c2[start_i] = p2[start_i]
-                else:
-                    c1[start_i] = p2[start_i]
-                    c2[start_i] = p1[start_i]
-
-                curr_i = p1.index(p2[start_i])
-                while curr_i != start_i:
-                    if turn == 0:
-                        c1[curr_i] = p1[curr_i]
-                        c2[curr_i] = p2[curr_i]
-                    else:
-                        c1[curr_i] = p2[curr_i]
-                        c2[curr_i] = p1[curr_i]
-                    curr_i = p1.index(p2[curr_i])
-                turn = (turn + 1) % 2
+        crossed = next(self._uniforms) < self.p_c
+        if crossed:
+            c1, c2 = cyclic_int(p1, p2)
         else:
-            c1, c2 = p1[:], p2[:]
+            c1, c2 = p1.copy(), p2.copy()
 
-        return c1, c2
+        return c1, c2, crossed
 
     # #########################
 
@@ -386,53 +568,41 @@ class SGA8Queens(object):
     # #################
 
     def swap_mutation(self, child):
-        rng = np.random.default_rng()
-
         # Mutation by switching the position of a two genes.
-        if rng.uniform() < self.p_m:
-            i, j = rng.choice(8, size=2, replace=False)
+        mutated = next(self._uniforms) < self.p_m
+        if mutated:
+            i, j = next(self._pairs)
             child[i], child[j] = child[j], child[i]
 
-        return child
+        return child, mutated
 
     def insert_mutation(self, child):
-        rng = np.random.default_rng()
-
-        if rng.uniform() < self.p_m:
-            i, j = rng.choice(8, size=2, replace=False)
-            if j < i:
-                i, j = j, i
+        mutated = next(self._uniforms) < self.p_m
+        if mutated:
+            i, j = next(self._pairs)
             # The idea here is to move the jth gene close to the ith gene.
-            child = child[:i+1] + [child[j]] + child[i+1:j] + child[j+1:]
+            gene = child[j]
+            child[i+2:j+1] = child[i+1:j]
+            child[i+1] = gene
 
-        return child
+        return child, mutated
 
     def scramble_mutation(self, child):
-        rng = np.random.default_rng()
-
-        if rng.uniform() < self.p_m:
-            i, j = rng.choice(8, size=2, replace=False)
-            if j < i:
-                i, j = j, i
-            shuffled_interval = child[i:j+1]
-            np.random.shuffle(shuffled_interval)
+        mutated = next(self._uniforms) < self.p_m
+        if mutated:
+            i, j = next(self._pairs)
             # Scramble the genes from i to j.
-            child = child[:i] + shuffled_interval + child[j+1:]
+            self.rng.shuffle(child[i:j+1])
 
-        return child
+        return child, mutated
 
     def inversion_mutation(self, child):
-        rng = np.random.default_rng()
-
-        if rng.uniform() < self.p_m:
-            i, j = rng.choice(8, size=2, replace=False)
-            if j < i:
-                i, j = j, i
-            reversed_chunk = child[i:j+1]
-            reversed_chunk.reverse()
-            child = child[:i] + reversed_chunk + child[j+1:]
+        mutated = next(self._uniforms) < self.p_m
+        if mutated:
+            i, j = next(self._pairs)
+            child[i:j+1] = child[i:j+1][::-1]
 
-        return child
+        return child, mutated
 
     # #########################
 
@@ -440,20 +610,22 @@ class SGA8Queens(object):
     # SURVIVOR SELECTION METHODS
     # ###########################
 
-    def replace_worst(self, c1, c2, p1, p2):
+    def replace_worst(self, c1, c2, c1_fit, c2_fit, p1_index, p2_index):
         # Find the two individuals with the lowest fitness value.
         weakest_solutions = np.argsort(self.pop_fitness)[:2]
         # Replace them by the childs.
-        self.population[weakest_solutions[0]] = c1[:]
-        self.population[weakest_solutions[1]] = c2[:]
+        self.population[weakest_solutions[0]] = c1
+        self.population[weakest_solutions[1]] = c2
+        # Update the fitness table.
+        self._set_fitness(weakest_solutions[0], c1_fit)
+        self._set_fitness(weakest_solutions[1], c2_fit)
+
+    def replace_parents_by_childs(self, c1, c2, c1_fit, c2_fit,
+                                  p1_index, p2_index):
+        self.population[p1_index] = c1
+        self.population[p2_index] = c2
         # Update the fitness table.
-        self.pop_fitness[weakest_solutions[0]] = self.fitness(c1)
-        self.pop_fitness[weakest_solutions[1]] = self.fitness(c2)
-
-    def replace_parents_by_childs(self, c1, c2, p1, p2):
-        p1_index = self.population.index(p1)
-        p2_index = self.population.index(p2)
-        self.population[p1_index] = c1[:]
-        self.population[p2_index] = c2[:]
+        self._set_fitness(p1_index, c1_fit)
+        self._set_fitness(p2_index, c2_fit)
 
     # #########################